@@ -16,6 +16,9 @@ Reference: BAB 2 Theory - Graf Berarah, Eigenvalue Centrality, Spectral Radius
 
 import pandas as pd
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eigvalsh
+from scipy.sparse.linalg import eigsh
 from typing import Tuple, Dict, List
 
 class HydraulicDrainageAnalyzer:
@@ -29,13 +32,13 @@ class HydraulicDrainageAnalyzer:
         # Data structures
         self.nodes = None
         self.edges = None
+        self.hydraulic_stats = None
         self.adj_matrix = None
-        self.degree_matrix = None
+        self.degrees = None
         self.laplacian = None
         
         # Spectral properties
         self.eigenvalues = None
-        self.eigenvectors = None
         self.spectral_radius = None
         self.algebraic_connectivity = None
         
@@ -58,70 +61,129 @@ class HydraulicDrainageAnalyzer:
         """Load nodes and edges data"""
         print("\n[1] Loading data...")
         
-        self.nodes = pd.read_csv(self.nodes_file)
-        self.edges = pd.read_csv(self.edges_file)
+        # Explicit dtypes and columns: no type inference pass, unused columns
+        # (channel_width, flow_rate, pipe_diameter) are never parsed.
+        # Hydraulic inputs stay float64 so the 2-decimal source values print
+        # unchanged; hydraulic_flow_analysis works in float32 internally.
+        hydraulic_dtype = np.float64
+        self.nodes = pd.read_csv(
+            self.nodes_file,
+            engine='c',
+            usecols=['node_id', 'latitude', 'longitude', 'type', 'elevation',
+                     'flow_capacity', 'sediment_risk', 'rainfall_intensity',
+                     'hydraulic_load'],
+            dtype={
+                'node_id': np.int32,
+                'latitude': np.float64,
+                'longitude': np.float64,
+                'type': str,
+                'elevation': hydraulic_dtype,
+                'flow_capacity': hydraulic_dtype,
+                'sediment_risk': hydraulic_dtype,
+                'rainfall_intensity': hydraulic_dtype,
+                'hydraulic_load': hydraulic_dtype,
+            }
+        )
+        self.edges = pd.read_csv(
+            self.edges_file,
+            engine='c',
+            usecols=['source', 'target'],
+            dtype={'source': np.int32, 'target': np.int32}
+        )
+        
+        # Min/max of the hydraulic columns, computed once and reused
+        self.hydraulic_stats = self.nodes[
+            ['elevation', 'flow_capacity', 'rainfall_intensity', 'sediment_risk']
+        ].agg(['min', 'max'])
         
         n_nodes = len(self.nodes)
         n_edges = len(self.edges)
         
         print(f"  ✓ Loaded {n_nodes} nodes")
         print(f"  ✓ Loaded {n_edges} edges")
+        stats = self.hydraulic_stats
         print(f"  ✓ Hydraulic parameters detected:")
-        print(f"    - Elevation: {self.nodes['elevation'].min():.1f} - {self.nodes['elevation'].max():.1f} m")
-        print(f"    - Flow capacity: {self.nodes['flow_capacity'].min():.1f} - {self.nodes['flow_capacity'].max():.1f} m³/s")
-        print(f"    - Rainfall: {self.nodes['rainfall_intensity'].min():.1f} - {self.nodes['rainfall_intensity'].max():.1f} mm/h")
-        print(f"    - Sediment risk: {self.nodes['sediment_risk'].min():.3f} - {self.nodes['sediment_risk'].max():.3f}")
+        print(f"    - Elevation: {stats['elevation']['min']:.1f} - {stats['elevation']['max']:.1f} m")
+        print(f"    - Flow capacity: {stats['flow_capacity']['min']:.1f} - {stats['flow_capacity']['max']:.1f} m³/s")
+        print(f"    - Rainfall: {stats['rainfall_intensity']['min']:.1f} - {stats['rainfall_intensity']['max']:.1f} mm/h")
+        print(f"    - Sediment risk: {stats['sediment_risk']['min']:.3f} - {stats['sediment_risk']['max']:.3f}")
     
     def construct_matrices(self):
         """
-        Construct adjacency, degree, and Laplacian matrices
+        Construct adjacency matrix, degree vector, and Laplacian matrix
         Use symmetric adjacency matrix (undirected graph treatment)
+        
+        Matrices disimpan dalam format sparse CSR: jaringan drainase
+        hanya memiliki O(1) tetangga per node, sehingga memori O(n + E)
         """
         print("\n[2] Constructing graph matrices...")
         
         n = len(self.nodes)
-        self.adj_matrix = np.zeros((n, n))
         
-        # Build symmetric adjacency matrix
-        for _, edge in self.edges.iterrows():
-            src = int(edge['source']) - 1
-            tgt = int(edge['target']) - 1
-            
-            # Symmetric: A[i,j] = A[j,i] = 1
-            self.adj_matrix[src, tgt] = 1
-            self.adj_matrix[tgt, src] = 1
-        
-        # Degree matrix
-        degrees = np.sum(self.adj_matrix, axis=1)
-        self.degree_matrix = np.diag(degrees)
-        
-        # Laplacian matrix: L = D - A
-        self.laplacian = self.degree_matrix - self.adj_matrix
-        
-        avg_degree = np.mean(degrees)
-        max_degree = np.max(degrees)
-        min_degree = np.min(degrees)
+        n_edges = len(self.edges)
         
-        print(f"  ✓ Adjacency matrix: {n}×{n} (symmetric)")
+        # Build symmetric adjacency matrix: A[i,j] = A[j,i] = 1
+        # COO triplets are written straight into preallocated buffers:
+        # rows = [src, tgt], cols = [tgt, src] (0-based), no temporaries
+        rows = np.empty(2 * n_edges, dtype=np.int32)
+        cols = np.empty(2 * n_edges, dtype=np.int32)
+        np.subtract(self.edges['source'].to_numpy(), 1, out=rows[:n_edges], casting='unsafe')
+        np.subtract(self.edges['target'].to_numpy(), 1, out=rows[n_edges:], casting='unsafe')
+        cols[:n_edges] = rows[n_edges:]
+        cols[n_edges:] = rows[:n_edges]
+        # float32: entries are 0/1, single precision halves SpMV traffic
+        self.adj_matrix = sp.coo_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n, n)
+        ).tocsr()
+        # Duplicate/reversed edges are summed by tocsr(); keep A binary
+        self.adj_matrix.data[:] = 1
+        
+        # Degree vector, computed once and reused by later steps
+        # Accumulate in float64 so the Laplacian keeps double precision
+        self.degrees = np.asarray(self.adj_matrix.sum(axis=1, dtype=np.float64)).ravel()
+        
+        # Laplacian matrix: L = D - A (D only as a transient sparse diagonal)
+        self.laplacian = (sp.diags(self.degrees) - self.adj_matrix).tocsr()
+        
+        avg_degree = np.mean(self.degrees)
+        max_degree = np.max(self.degrees)
+        min_degree = np.min(self.degrees)
+        
+        print(f"  ✓ Adjacency matrix: {n}×{n} (symmetric, {self.adj_matrix.nnz} non-zeros)")
         print(f"  ✓ Degree statistics:")
         print(f"    - Average degree: {avg_degree:.2f}")
         print(f"    - Max degree: {int(max_degree)}")
         print(f"    - Min degree: {int(min_degree)}")
     
-    def spectral_analysis(self):
+    def spectral_analysis(self, dense_max_nodes: int = 300):
         """
         Perform eigenvalue decomposition on Laplacian matrix
         Compute algebraic connectivity (λ₂) and spectral properties
+        
+        Graf kecil (n ≤ dense_max_nodes): dekomposisi dense LAPACK
+        divide-and-conquer (?syevd), lebih cepat dari overhead ARPACK.
+        Graf besar: hanya λ₁, λ₂ dan λ_max via Lanczos (ARPACK eigsh)
+        pada matriks sparse, bukan dekomposisi penuh.
         """
         print("\n[3] Spectral Analysis (Eigenvalue Decomposition)...")
         
-        # Eigenvalue decomposition (symmetric matrix)
-        eigenvalues, eigenvectors = np.linalg.eigh(self.laplacian)
+        n = self.laplacian.shape[0]
         
-        # Sort by eigenvalue (ascending)
-        idx = np.argsort(eigenvalues)
-        self.eigenvalues = eigenvalues[idx]
-        self.eigenvectors = eigenvectors[:, idx]
+        if n <= dense_max_nodes:
+            # Full spectrum, eigenvalues only (returned in ascending order).
+            # The dense copy is a throwaway, so LAPACK may work in place.
+            self.eigenvalues = eigvalsh(self.laplacian.toarray(), driver='evd',
+                                        overwrite_a=True, check_finite=False)
+        else:
+            # Two smallest eigenvalues via shift-invert around σ < 0
+            # (L - σI is positive definite, so the factorization is safe)
+            smallest = eigsh(self.laplacian, k=2, sigma=-1e-2, which='LM',
+                             return_eigenvectors=False)
+            largest = eigsh(self.laplacian, k=1, which='LA',
+                            return_eigenvectors=False)
+            
+            # Sort by eigenvalue (ascending)
+            self.eigenvalues = np.sort(np.concatenate([smallest, largest]))
         
         # Algebraic connectivity (second smallest eigenvalue)
         self.algebraic_connectivity = self.eigenvalues[1]
@@ -136,69 +198,74 @@ class HydraulicDrainageAnalyzer:
         else:
             print(f"    ✓ λ₂ ≥ 0.5 → Network relatif robust")
     
-    def compute_spectral_radius(self):
-        """
-        Compute spectral radius ρ(A) = max|λᵢ(A)|
-        Spectral radius indicates network stability and connectivity spread
-        """
-        print("\n[4] Computing Spectral Radius ρ(A)...")
-        
-        # Eigenvalues of adjacency matrix (for spectral radius)
-        adj_eigenvalues = np.linalg.eigvalsh(self.adj_matrix)
-        self.spectral_radius = np.max(np.abs(adj_eigenvalues))
-        
-        print(f"  ✓ Spectral radius ρ(A): {self.spectral_radius:.6f}")
-        print(f"  ✓ Interpretation:")
-        
-        n = len(self.nodes)
-        avg_degree = np.mean(np.sum(self.adj_matrix, axis=1))
-        
-        if self.spectral_radius > avg_degree * 1.5:
-            print(f"    → High spectral radius: dominasi hub nodes (star-like topology)")
-        elif self.spectral_radius > avg_degree * 1.2:
-            print(f"    → Moderate: beberapa hub nodes signifikan")
-        else:
-            print(f"    → Low: distribusi koneksi merata (mesh-like topology)")
-    
-    def power_iteration_centrality(self, max_iter: int = 100, tol: float = 1e-6):
+    def power_iteration_centrality(self, max_iter: int = 100, tol: float = 1e-6,
+                                   method: str = 'arpack'):
         """
-        Compute eigenvalue centrality using power iteration method
+        Compute eigenvalue centrality (dominant eigenvector of A)
         Iterative method untuk mencari eigenvector dengan eigenvalue terbesar
         
-        Power iteration formula:
+        method='arpack' (default): implicitly restarted Lanczos (eigsh).
+        Konvergensi power iteration diatur oleh |λ₂/λ₁|, yang mendekati 1
+        pada jaringan drainase; Lanczos konvergen dengan jauh lebih sedikit
+        SpMV dan memberikan eigenvector eksak.
+        
+        method='power': power iteration klasik
         x_{k+1} = A·x_k / ||A·x_k||
         
         Converges to dominant eigenvector (highest eigenvalue)
+        Rayleigh quotient x_kᵀ·A·x_k converges to the dominant eigenvalue,
+        i.e. ρ(A); iterasi berhenti saat perubahan relatifnya < tol
         """
-        print("\n[5] Power Iteration Method (Eigenvalue Centrality)...")
-        
-        n = len(self.nodes)
-        
-        # Initial random vector
-        x = np.random.rand(n)
-        x = x / np.linalg.norm(x)
-        
-        for iteration in range(max_iter):
-            # Power iteration step
-            x_new = self.adj_matrix @ x
-            x_new_norm = np.linalg.norm(x_new)
+        if method == 'arpack':
+            print("\n[4] Eigenvalue Centrality (ARPACK Lanczos)...")
             
-            if x_new_norm < 1e-10:
-                print(f"    ⚠ Warning: vector norm too small, using degree centrality fallback")
-                x_new = np.sum(self.adj_matrix, axis=1)
-                x_new = x_new / np.linalg.norm(x_new)
-                break
+            # A is nonnegative, so the Perron eigenvalue is the largest algebraic one.
+            # The degree vector is a positive start close to the Perron vector.
+            vals, vecs = eigsh(self.adj_matrix, k=1, which='LA', tol=tol,
+                               v0=self.degrees.astype(np.float32))
+            x = vecs[:, 0]
+            self.spectral_radius = vals[0]
+            print(f"    ✓ Converged (ARPACK)")
+        elif method == 'power':
+            print("\n[4] Power Iteration Method (Eigenvalue Centrality)...")
             
-            x_new = x_new / x_new_norm
+            n = len(self.nodes)
             
-            # Check convergence
-            if np.linalg.norm(x_new - x) < tol:
-                print(f"    ✓ Converged in {iteration+1} iterations")
-                break
+            # Initial random vector
+            x = np.random.rand(n).astype(np.float32)
+            x = x / np.linalg.norm(x)
+            Ax = self.adj_matrix @ x
+            rayleigh = x @ Ax
             
-            x = x_new
+            for iteration in range(max_iter):
+                # Power iteration step (A·x_k carried over from the last step)
+                x_new_norm = np.linalg.norm(Ax)
+                
+                if x_new_norm < 1e-10:
+                    print(f"    ⚠ Warning: vector norm too small, using degree centrality fallback")
+                    x_new = self.degrees.astype(np.float32)
+                    x_new = x_new / np.linalg.norm(x_new)
+                    break
+                
+                x = Ax / x_new_norm
+                Ax = self.adj_matrix @ x
+                
+                # Check convergence on the Rayleigh quotient λ = xᵀ·A·x,
+                # which converges quadratically for symmetric A
+                rayleigh_new = x @ Ax
+                converged = abs(rayleigh_new - rayleigh) < tol * abs(rayleigh_new)
+                rayleigh = rayleigh_new
+                
+                if converged:
+                    print(f"    ✓ Converged in {iteration+1} iterations")
+                    break
+            else:
+                print(f"    ✓ Max iterations reached ({max_iter})")
+            
+            # Rayleigh quotient → dominant eigenvalue (spectral radius)
+            self.spectral_radius = rayleigh
         else:
-            print(f"    ✓ Max iterations reached ({max_iter})")
+            raise ValueError(f"Unknown method '{method}', expected 'arpack' or 'power'")
         
         self.eigenvalue_centrality = np.abs(x)
         
@@ -210,6 +277,31 @@ class HydraulicDrainageAnalyzer:
         print(f"  ✓ Eigenvalue centrality computed")
         print(f"    Range: [{self.eigenvalue_centrality.min():.4f}, {self.eigenvalue_centrality.max():.4f}]")
     
+    def compute_spectral_radius(self):
+        """
+        Compute spectral radius ρ(A) = max|λᵢ(A)|
+        Spectral radius indicates network stability and connectivity spread
+        
+        ρ(A) diambil dari perhitungan eigenvalue centrality (eigenvalue
+        dominan A), sehingga tidak perlu dekomposisi eigen terpisah pada A
+        """
+        print("\n[5] Computing Spectral Radius ρ(A)...")
+        
+        if self.spectral_radius is None:
+            self.power_iteration_centrality()
+        
+        print(f"  ✓ Spectral radius ρ(A): {self.spectral_radius:.6f}")
+        print(f"  ✓ Interpretation:")
+        
+        avg_degree = np.mean(self.degrees)
+        
+        if self.spectral_radius > avg_degree * 1.5:
+            print(f"    → High spectral radius: dominasi hub nodes (star-like topology)")
+        elif self.spectral_radius > avg_degree * 1.2:
+            print(f"    → Moderate: beberapa hub nodes signifikan")
+        else:
+            print(f"    → Low: distribusi koneksi merata (mesh-like topology)")
+    
     def compute_degree_centrality(self):
         """
         Compute normalized degree centrality
@@ -217,10 +309,9 @@ class HydraulicDrainageAnalyzer:
         """
         print("\n[6] Computing Degree Centrality...")
         
-        degrees = np.sum(self.adj_matrix, axis=1)
         n = len(self.nodes)
         
-        self.degree_centrality = degrees / (n - 1)
+        self.degree_centrality = self.degrees.astype(np.float32) / (n - 1)
         
         print(f"  ✓ Degree centrality computed")
         print(f"    Range: [{self.degree_centrality.min():.4f}, {self.degree_centrality.max():.4f}]")
@@ -239,36 +330,44 @@ class HydraulicDrainageAnalyzer:
         """
         print("\n[7] Hydraulic Flow Analysis...")
         
+        n = len(self.nodes)
+        
+        # Risk components are written in place into the columns of one
+        # (n,4) float32 buffer; column-major so every column is contiguous
+        risks = np.empty((n, 4), dtype=np.float32, order='F')
+        elevation_risk, capacity_risk, sediment_risk, load_risk = risks.T
+        
         # 1. Elevation risk (lower = higher risk)
         elevation = self.nodes['elevation'].values
-        elevation_risk = 1 - (elevation - elevation.min()) / (elevation.max() - elevation.min())
+        elevation_min, elevation_max = self.hydraulic_stats['elevation'].to_numpy()
+        np.subtract(elevation, elevation_min, out=elevation_risk)
+        elevation_risk /= elevation_min - elevation_max
+        elevation_risk += 1
         
         # 2. Capacity risk (rainfall/capacity ratio)
         rainfall = self.nodes['rainfall_intensity'].values
         capacity = self.nodes['flow_capacity'].values
-        capacity_risk = rainfall / (capacity * 10)  # normalize
-        capacity_risk = np.clip(capacity_risk, 0, 1)
+        np.multiply(capacity, 10, out=capacity_risk)  # normalize
+        np.divide(rainfall, capacity_risk, out=capacity_risk)
+        np.clip(capacity_risk, 0, 1, out=capacity_risk)
         
         # 3. Sediment risk (direct from data)
-        sediment_risk = self.nodes['sediment_risk'].values
+        sediment_risk[:] = self.nodes['sediment_risk'].values
         
         # 4. Hydraulic load risk (direct from data)
-        load_risk = self.nodes['hydraulic_load'].values
+        load_risk[:] = self.nodes['hydraulic_load'].values
         
-        # Weighted combination
+        # Weighted combination as a single (n,4)·(4,) matrix-vector product
         w1, w2, w3, w4 = 0.25, 0.30, 0.25, 0.20
         
-        self.hydraulic_vulnerability = (
-            w1 * elevation_risk + 
-            w2 * capacity_risk + 
-            w3 * sediment_risk + 
-            w4 * load_risk
-        )
+        hydraulic_vulnerability = risks @ np.array([w1, w2, w3, w4], dtype=np.float32)
         
         # Normalize to [0, 1]
-        self.hydraulic_vulnerability = (self.hydraulic_vulnerability - self.hydraulic_vulnerability.min())
-        if self.hydraulic_vulnerability.max() > 0:
-            self.hydraulic_vulnerability = self.hydraulic_vulnerability / self.hydraulic_vulnerability.max()
+        hydraulic_vulnerability -= hydraulic_vulnerability.min()
+        hydraulic_max = hydraulic_vulnerability.max()
+        if hydraulic_max > 0:
+            hydraulic_vulnerability /= hydraulic_max
+        self.hydraulic_vulnerability = hydraulic_vulnerability
         
         print(f"  ✓ Hydraulic vulnerability computed")
         print(f"    Components:")
@@ -297,18 +396,20 @@ class HydraulicDrainageAnalyzer:
         w_degree = 0.30
         w_hydraulic = 0.40
         
-        # Combined vulnerability
-        self.vulnerability_scores = (
-            w_eigen * self.eigenvalue_centrality +
-            w_degree * self.degree_centrality +
-            w_hydraulic * self.hydraulic_vulnerability
-        )
+        # Combined vulnerability as a single (n,3)·(3,) matrix-vector product
+        factors = np.column_stack([
+            self.eigenvalue_centrality,
+            self.degree_centrality,
+            self.hydraulic_vulnerability
+        ])
+        self.vulnerability_scores = factors @ np.array([w_eigen, w_degree, w_hydraulic],
+                                                       dtype=np.float32)
         
-        # Power transformation for better distribution
-        self.vulnerability_scores = np.power(self.vulnerability_scores, 0.7)
+        # Power transformation for better distribution (exponent 0.7 as in BAB 2)
+        np.power(self.vulnerability_scores, 0.7, out=self.vulnerability_scores)
         
         # Scale to max 0.95 (avoid perfect 1.0)
-        self.vulnerability_scores = self.vulnerability_scores * (0.95 / self.vulnerability_scores.max())
+        self.vulnerability_scores *= 0.95 / self.vulnerability_scores.max()
         
         print(f"  ✓ Integrated vulnerability computed")
         print(f"    Weights:")
@@ -327,18 +428,16 @@ class HydraulicDrainageAnalyzer:
         high_threshold = np.percentile(self.vulnerability_scores, 70)
         low_threshold = np.percentile(self.vulnerability_scores, 30)
         
-        categories = []
-        for score in self.vulnerability_scores:
-            if score >= high_threshold:
-                categories.append('high')
-            elif score <= low_threshold:
-                categories.append('low')
-            else:
-                categories.append('medium')
+        categories = np.select(
+            [self.vulnerability_scores >= high_threshold,
+             self.vulnerability_scores <= low_threshold],
+            ['high', 'low'],
+            default='medium'
+        )
         
-        n_high = categories.count('high')
-        n_medium = categories.count('medium')
-        n_low = categories.count('low')
+        n_high = np.count_nonzero(categories == 'high')
+        n_medium = np.count_nonzero(categories == 'medium')
+        n_low = np.count_nonzero(categories == 'low')
         
         print(f"  ✓ Classification thresholds:")
         print(f"    - High: vulnerability ≥ {high_threshold:.3f}")
@@ -363,29 +462,30 @@ class HydraulicDrainageAnalyzer:
         categories = self.classify_vulnerability()
         
         # Get node degrees
-        degrees = np.sum(self.adj_matrix, axis=1).astype(int)
-        
-        # Create results dataframe
-        results = pd.DataFrame({
-            'node_id': self.nodes['node_id'],
-            'latitude': self.nodes['latitude'],
-            'longitude': self.nodes['longitude'],
-            'type': self.nodes['type'],
+        degrees = self.degrees.astype(int)
+        
+        # Result columns as plain numpy arrays (no pandas index alignment)
+        columns = {
+            'node_id': self.nodes['node_id'].to_numpy(),
+            'latitude': self.nodes['latitude'].to_numpy(),
+            'longitude': self.nodes['longitude'].to_numpy(),
+            'type': self.nodes['type'].to_numpy(),
             'degree': degrees,
             'eigenvalue_centrality': self.eigenvalue_centrality,
             'degree_centrality': self.degree_centrality,
             'hydraulic_vulnerability': self.hydraulic_vulnerability,
             'vulnerability_score': self.vulnerability_scores,
             'vulnerability_category': categories,
-            'elevation': self.nodes['elevation'],
-            'flow_capacity': self.nodes['flow_capacity'],
-            'rainfall_intensity': self.nodes['rainfall_intensity'],
-            'sediment_risk': self.nodes['sediment_risk'],
-            'hydraulic_load': self.nodes['hydraulic_load'],
-        })
+            'elevation': self.nodes['elevation'].to_numpy(),
+            'flow_capacity': self.nodes['flow_capacity'].to_numpy(),
+            'rainfall_intensity': self.nodes['rainfall_intensity'].to_numpy(),
+            'sediment_risk': self.nodes['sediment_risk'].to_numpy(),
+            'hydraulic_load': self.nodes['hydraulic_load'].to_numpy(),
+        }
         
-        # Sort by vulnerability (descending)
-        results = results.sort_values('vulnerability_score', ascending=False)
+        # Sort by vulnerability (descending): one permutation applied per column
+        order = np.argsort(-self.vulnerability_scores, kind='stable')
+        results = pd.DataFrame({col: arr[order] for col, arr in columns.items()}, index=order)
         
         print(f"  ✓ Report data generated")
         
@@ -404,15 +504,15 @@ class HydraulicDrainageAnalyzer:
         print(f"\n{'Node':<6} {'Deg':<5} {'Vuln':<7} {'Category':<10} {'Type':<12} {'Elev':<7} {'Capacity':<9} {'Rain':<7} {'Sediment':<9}")
         print("-"*86)
         
-        for _, node in top_nodes.iterrows():
-            print(f"{node['node_id']:<6} {node['degree']:<5} "
-                  f"{node['vulnerability_score']:.3f}   "
-                  f"{node['vulnerability_category']:<10} "
-                  f"{node['type']:<12} "
-                  f"{node['elevation']:>5.1f}m  "
-                  f"{node['flow_capacity']:>6.1f}m³/s "
-                  f"{node['rainfall_intensity']:>5.1f}mm/h "
-                  f"{node['sediment_risk']:.3f}")
+        for node in top_nodes.itertuples(index=False):
+            print(f"{node.node_id:<6} {node.degree:<5} "
+                  f"{node.vulnerability_score:.3f}   "
+                  f"{node.vulnerability_category:<10} "
+                  f"{node.type:<12} "
+                  f"{node.elevation:>5.1f}m  "
+                  f"{node.flow_capacity:>6.1f}m³/s "
+                  f"{node.rainfall_intensity:>5.1f}mm/h "
+                  f"{node.sediment_risk:.3f}")
     
     def print_network_statistics(self):
         """
@@ -427,17 +527,17 @@ class HydraulicDrainageAnalyzer:
         print(f"  • Spectral radius ρ(A): {self.spectral_radius:.6f}")
         print(f"  • Eigenvalue range: [{self.eigenvalues.min():.6f}, {self.eigenvalues.max():.6f}]")
         
-        degrees = np.sum(self.adj_matrix, axis=1)
         print(f"\n🔗 Connectivity:")
-        print(f"  • Average degree: {np.mean(degrees):.2f}")
-        print(f"  • Max degree: {int(np.max(degrees))}")
-        print(f"  • Min degree: {int(np.min(degrees))}")
+        print(f"  • Average degree: {np.mean(self.degrees):.2f}")
+        print(f"  • Max degree: {int(np.max(self.degrees))}")
+        print(f"  • Min degree: {int(np.min(self.degrees))}")
         
+        stats = self.hydraulic_stats
         print(f"\n💧 Hydraulic Parameters:")
-        print(f"  • Elevation: {self.nodes['elevation'].min():.1f} - {self.nodes['elevation'].max():.1f} m")
-        print(f"  • Flow capacity: {self.nodes['flow_capacity'].min():.1f} - {self.nodes['flow_capacity'].max():.1f} m³/s")
-        print(f"  • Rainfall: {self.nodes['rainfall_intensity'].min():.1f} - {self.nodes['rainfall_intensity'].max():.1f} mm/h")
-        print(f"  • Sediment risk: {self.nodes['sediment_risk'].min():.3f} - {self.nodes['sediment_risk'].max():.3f}")
+        print(f"  • Elevation: {stats['elevation']['min']:.1f} - {stats['elevation']['max']:.1f} m")
+        print(f"  • Flow capacity: {stats['flow_capacity']['min']:.1f} - {stats['flow_capacity']['max']:.1f} m³/s")
+        print(f"  • Rainfall: {stats['rainfall_intensity']['min']:.1f} - {stats['rainfall_intensity']['max']:.1f} mm/h")
+        print(f"  • Sediment risk: {stats['sediment_risk']['min']:.3f} - {stats['sediment_risk']['max']:.3f}")
         
         print(f"\n⚠️ Vulnerability:")
         print(f"  • Score range: {self.vulnerability_scores.min():.3f} - {self.vulnerability_scores.max():.3f}")
@@ -451,8 +551,8 @@ class HydraulicDrainageAnalyzer:
         self.load_data()
         self.construct_matrices()
         self.spectral_analysis()
-        self.compute_spectral_radius()
         self.power_iteration_centrality()
+        self.compute_spectral_radius()
         self.compute_degree_centrality()
         self.hydraulic_flow_analysis()
         self.compute_integrated_vulnerability()